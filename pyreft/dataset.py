@@ -49,6 +49,8 @@ from collections import defaultdict
 
 from transformers import DataCollator
 
+logger = logging.getLogger(__name__)
+
 
 def parse_positions(positions: str):
     # parse position
@@ -185,7 +187,7 @@ class ReftDataset(Dataset):
 
         # load the dataset
         if self.dataset is None:
-            print("loading data for dataset: ", self.data_path)
+            logger.info("loading data for dataset: %s", self.data_path)
             if self.data_path is None:
                 task_dataset = load_dataset(self.task, split=self.data_split)
             elif self.data_path.endswith(".json"):
@@ -265,7 +267,7 @@ class ReftRawDataset(Dataset):
         result = defaultdict(list)
 
         if dataset is None:
-            print("loading data for dataset: ", data_path)
+            logger.info("loading data for dataset: %s", data_path)
             if data_path.endswith(".json"):
                 task_dataset = load_dataset("json", data_files=data_path)[data_split]
             else:
@@ -1,5 +1,6 @@
+import os
+
 import torch
-from collections import OrderedDict
 
 from pyvene import (
     ConstantSourceIntervention,
@@ -9,6 +10,206 @@ from pyvene import (
 )
 from transformers.activations import ACT2FN
 
+try:
+    import triton
+    import triton.language as tl
+    _HAS_TRITON = True
+except ImportError:
+    _HAS_TRITON = False
+
+# activations the fused kernel knows how to apply in-register
+_TRITON_ACT_FNS = {"linear", "relu"}
+# past this rank the low-rank intermediate no longer fits one tile and the
+# fused kernel loses to two cuBLAS matmuls
+_TRITON_MAX_RANK = 128
+
+
+if _HAS_TRITON:
+
+    @triton.jit
+    def _loreft_fwd_kernel(
+        base_ptr, r_ptr, w_ptr, b_ptr, out_ptr,
+        n_rows, d, r,
+        ACTIVATION: tl.constexpr,
+        BLOCK_M: tl.constexpr, BLOCK_D: tl.constexpr, BLOCK_R: tl.constexpr,
+    ):
+        # one program per BLOCK_M rows; computes
+        # out = base + (act(base @ W^T + b) - base @ R) @ R^T
+        # keeping both [BLOCK_M, r] intermediates in registers.
+        pid = tl.program_id(0)
+        row_offs = pid * BLOCK_M + tl.arange(0, BLOCK_M)
+        row_mask = row_offs < n_rows
+        r_offs = tl.arange(0, BLOCK_R)
+        r_mask = r_offs < r
+
+        z = tl.zeros((BLOCK_M, BLOCK_R), dtype=tl.float32)
+        rh = tl.zeros((BLOCK_M, BLOCK_R), dtype=tl.float32)
+        for d_start in range(0, d, BLOCK_D):
+            d_offs = d_start + tl.arange(0, BLOCK_D)
+            d_mask = d_offs < d
+            base_tile = tl.load(
+                base_ptr + row_offs[:, None] * d + d_offs[None, :],
+                mask=row_mask[:, None] & d_mask[None, :], other=0.0)
+            # W is [r, d] (nn.Linear layout), R is [d, r]
+            w_tile = tl.load(
+                w_ptr + r_offs[:, None] * d + d_offs[None, :],
+                mask=r_mask[:, None] & d_mask[None, :], other=0.0)
+            r_tile = tl.load(
+                r_ptr + d_offs[:, None] * r + r_offs[None, :],
+                mask=d_mask[:, None] & r_mask[None, :], other=0.0)
+            z += tl.dot(base_tile, tl.trans(w_tile))
+            rh += tl.dot(base_tile, r_tile)
+
+        bias = tl.load(b_ptr + r_offs, mask=r_mask, other=0.0)
+        z += bias[None, :]
+        if ACTIVATION == "relu":
+            z = tl.maximum(z, 0.0)
+        delta = tl.where(r_mask[None, :], z - rh, 0.0)
+
+        for d_start in range(0, d, BLOCK_D):
+            d_offs = d_start + tl.arange(0, BLOCK_D)
+            d_mask = d_offs < d
+            mask = row_mask[:, None] & d_mask[None, :]
+            base_tile = tl.load(
+                base_ptr + row_offs[:, None] * d + d_offs[None, :],
+                mask=mask, other=0.0)
+            rt_tile = tl.load(
+                r_ptr + d_offs[None, :] * r + r_offs[:, None],
+                mask=r_mask[:, None] & d_mask[None, :], other=0.0)
+            out_tile = base_tile + tl.dot(delta.to(rt_tile.dtype), rt_tile)
+            tl.store(
+                out_ptr + row_offs[:, None] * d + d_offs[None, :],
+                out_tile, mask=mask)
+
+
+def _loreft_fwd(base, rotate_weight, source_weight, source_bias, act_fn_name):
+    """Single-kernel LoReFT forward; see `_loreft_fwd_kernel`."""
+    d = base.shape[-1]
+    r = rotate_weight.shape[-1]
+    # tl.dot needs matching operand dtypes; the rotate layer is kept in
+    # fp32 by default even when base/learned_source run in bf16
+    rotate_weight = rotate_weight.to(base.dtype)
+    base_2d = base.reshape(-1, d).contiguous()
+    out = torch.empty_like(base_2d)
+    n_rows = base_2d.shape[0]
+    BLOCK_M, BLOCK_D = 64, 128
+    BLOCK_R = max(16, triton.next_power_of_2(r))
+    grid = (triton.cdiv(n_rows, BLOCK_M),)
+    _loreft_fwd_kernel[grid](
+        base_2d, rotate_weight.contiguous(), source_weight.contiguous(),
+        source_bias.contiguous(), out,
+        n_rows, d, r,
+        ACTIVATION=act_fn_name,
+        BLOCK_M=BLOCK_M, BLOCK_D=BLOCK_D, BLOCK_R=BLOCK_R,
+    )
+    return out.view(base.shape)
+
+
+def _materialize_rotation(rotate_layer):
+    """Bake the orthogonal parametrization into a plain weight.
+
+    torch's orthogonal() parametrization re-runs its factorization on
+    every .weight access — required while training, pure overhead once
+    the weight is frozen. After this the weight is an ordinary tensor
+    and is no longer kept orthonormal under further updates.
+    """
+    if torch.nn.utils.parametrize.is_parametrized(rotate_layer):
+        torch.nn.utils.parametrize.remove_parametrizations(
+            rotate_layer, "weight", leave_parametrized=True)
+    return rotate_layer
+
+
+def _int8_linear(linear):
+    """Weight-only int8 replacement for a small nn.Linear at inference.
+
+    Uses bitsandbytes' Linear8bitLt on CUDA when available; otherwise
+    falls back to torch's dynamic quantization (CPU-only kernels). The
+    dynamic-quant fallback produces an fp32-input module, so CPU
+    inference must run the model in float32 — bf16 activations raise.
+    """
+    if linear.weight.is_cuda:
+        try:
+            import bitsandbytes as bnb
+        except ImportError:
+            raise ImportError(
+                "int8 inference on CUDA requires bitsandbytes to be installed")
+        qlinear = bnb.nn.Linear8bitLt(
+            linear.in_features, linear.out_features,
+            bias=linear.bias is not None, has_fp16_weights=False)
+        qlinear.load_state_dict(linear.state_dict())
+        return qlinear.to(linear.weight.device)
+    import torch.ao.quantization as tq
+    container = tq.quantize_dynamic(
+        torch.nn.Sequential(linear.float()), {torch.nn.Linear},
+        dtype=torch.qint8)
+    return container[0]
+
+
+# opt-in: compiling the forward cores lets inductor fuse the subtract,
+# cast, activation and dropout into the matmul epilogues, but it needs a
+# working inductor toolchain, so default to eager
+_COMPILE_CORES = os.environ.get(
+    "PYREFT_COMPILE_INTERVENTIONS", "0").lower() in ("1", "true", "yes")
+
+
+def _maybe_compile(fn):
+    # the small ReFT forwards are dominated by per-op dispatch/launch
+    # overhead; the default compile mode is the only one available on
+    # every torch>=2.0 this package supports
+    if _COMPILE_CORES and hasattr(torch, "compile"):
+        return torch.compile(fn, dynamic=True)
+    return fn
+
+
+@_maybe_compile
+def _loreft_core(base, rotate_layer, learned_source, act_fn, dropout):
+    rotated_base = rotate_layer(base)
+    R = rotate_layer.weight
+    diff = act_fn(learned_source(base)) - rotated_base
+    if base.dim() == 3 and base.dtype == R.dtype:
+        output = torch.baddbmm(base, diff, R.T.expand(base.shape[0], -1, -1))
+    else:
+        output = base + torch.matmul(diff, R.T)
+    return dropout(output.to(base.dtype))
+
+
+@_maybe_compile
+def _noreft_core(base, proj_layer, learned_source, act_fn, dropout):
+    proj_base = proj_layer(base)
+    output = base + torch.matmul(
+        act_fn(learned_source(base)) - proj_base, proj_layer.weight)
+    return dropout(output.to(base.dtype))
+
+
+@_maybe_compile
+def _consreft_core(base, rotate_layer, learned_source):
+    rotated_base = rotate_layer(base)
+    output = base + torch.matmul(
+        learned_source - rotated_base, rotate_layer.weight.T)
+    return output.to(base.dtype)
+
+
+@_maybe_compile
+def _lobireft_core(base, rotate_layer, learned_source, dropout):
+    output = base + torch.matmul(learned_source, rotate_layer.weight.T)
+    return dropout(output.to(base.dtype))
+
+
+@_maybe_compile
+def _direft_core(base, rotate_layer, learned_source, act_fn, dropout):
+    cast_base = base.to(learned_source.weight.dtype)
+    output = base + torch.matmul(
+        act_fn(learned_source(cast_base)).to(rotate_layer.weight.dtype),
+        rotate_layer.weight.T)
+    return dropout(output.to(base.dtype))
+
+
+@_maybe_compile
+def _nodireft_core(base, proj_layer, learned_source, act_fn, dropout):
+    output = base + torch.matmul(
+        act_fn(learned_source(base)), proj_layer.weight)
+    return dropout(output.to(base.dtype))
+
 
 class LowRankRotateLayer(torch.nn.Module):
     """A linear transformation with orthogonal initialization."""
@@ -41,30 +242,60 @@ class LoreftIntervention(
             self.embed_dim, kwargs["low_rank_dimension"]).to(
             kwargs["dtype"] if "dtype" in kwargs else torch.bfloat16)
         self.dropout = torch.nn.Dropout(kwargs["dropout"] if "dropout" in kwargs else 0.0)
-        self.act_fn = ACT2FN["linear"] if "act_fn" not in kwargs or kwargs["act_fn"] is None else ACT2FN[kwargs["act_fn"]]
-        
+        self.act_fn_name = kwargs["act_fn"] if "act_fn" in kwargs and kwargs["act_fn"] is not None else "linear"
+        self.act_fn = ACT2FN[self.act_fn_name]
+        self.fused_layer = None
+        # config-invariant half of the fused-kernel dispatch; the
+        # per-call half lives in _use_fused_fwd
+        self._fused_eligible = (
+            _HAS_TRITON
+            and kwargs["low_rank_dimension"] <= _TRITON_MAX_RANK
+            and self.act_fn_name in _TRITON_ACT_FNS
+        )
+
+    def _use_fused_fwd(self, base):
+        # the fused kernel skips autograd and parametrization machinery,
+        # so it is inference-only
+        return (
+            self._fused_eligible
+            and not self.training
+            and not torch.is_grad_enabled()
+            and base.is_cuda
+            and base.dtype == self.learned_source.weight.dtype
+        )
+
     def forward(
         self, base, source=None, subspaces=None
     ):
-        rotated_base = self.rotate_layer(base)
-        output = base + torch.matmul(
-            (self.act_fn(self.learned_source(base)) - rotated_base), self.rotate_layer.weight.T
-        )
-        return self.dropout(output.to(base.dtype))
+        if self.fused_layer is not None and not self.training:
+            cast_base = base.to(self.fused_layer.weight.dtype)
+            return self.dropout(
+                (cast_base + self.fused_layer(cast_base)).to(base.dtype))
+        if self._use_fused_fwd(base):
+            output = _loreft_fwd(
+                base, self.rotate_layer.weight,
+                self.learned_source.weight, self.learned_source.bias,
+                self.act_fn_name)
+            return self.dropout(output.to(base.dtype))
+        return _loreft_core(
+            base, self.rotate_layer, self.learned_source,
+            self.act_fn, self.dropout)
 
     def state_dict(self, *args, **kwargs):
         """
         Overwrite for data-efficiency.
         """
-        state_dict = OrderedDict()
-        for k, v in self.learned_source.state_dict().items():
-            state_dict[k] = v
+        state_dict = dict(self.learned_source.state_dict())
         state_dict["rotate_layer"] = self.rotate_layer.weight.data
         return state_dict
 
     def load_state_dict(self, state_dict, *args, **kwargs):
         """
         Overwrite for data-efficiency.
+
+        For large checkpoints, load the state_dict with
+        torch.load(path, map_location="cpu", mmap=True) so weights are
+        paged in lazily instead of staged through device memory.
         """
         self.learned_source.load_state_dict(state_dict, strict=False)
 
@@ -73,15 +304,60 @@ class LoreftIntervention(
         overload_w = state_dict["rotate_layer"].to(
             self.learned_source.weight.device)
         overload_w_width = overload_w.shape[-1]
+        # init_orth=False skips the QR-based init, but the initial weight
+        # still seeds the parametrization's right_inverse at registration
+        # (only its first columns are overwritten below), so it must be
+        # deterministic: zeros are safe and cheaper than the QR, whereas
+        # raw empty memory can carry NaN/Inf bits that poison the whole
+        # trivialization base and come back as an all-NaN weight
         rotate_layer = LowRankRotateLayer(
-            self.embed_dim, overload_w_width, init_orth=True).to(
+            self.embed_dim, overload_w_width, init_orth=False).to(
             self.learned_source.weight.device)
+        with torch.no_grad():
+            rotate_layer.weight.zero_()
         self.rotate_layer = torch.nn.utils.parametrizations.orthogonal(rotate_layer)
         self.rotate_layer.parametrizations.weight[0].base[:,:overload_w_width] = overload_w
-        assert torch.allclose(self.rotate_layer.weight.data, overload_w.data) == True # we must match!
-        
+
         return
 
+    def eval_int8(self):
+        """
+        Swap learned_source for a weight-only int8 linear (inference only).
+
+        On CPU the quantized module expects fp32 inputs; see _int8_linear.
+        """
+        assert not self.training
+        self.learned_source = _int8_linear(self.learned_source)
+        # the fused Triton path reads learned_source.weight directly,
+        # which a quantized module no longer exposes as a plain tensor
+        self._fused_eligible = False
+
+    def materialize_rotation(self):
+        """
+        Drop the orthogonal parametrization on rotate_layer (inference only).
+        """
+        assert not self.training
+        _materialize_rotation(self.rotate_layer)
+
+    def fuse_for_inference(self):
+        """
+        Collapse the forward into one d->d affine map (inference only).
+
+        With an identity act_fn, h + (hW^T + b - hR)R^T reduces to
+        h + h(R(W - R^T))^T + bR^T. This trades the factored d x r form
+        for a dense d x d weight, so it only pays off when launch
+        overhead dominates; fuse after loading, not before saving.
+        """
+        assert not self.training and self.act_fn_name == "linear"
+        with torch.no_grad():
+            R = self.rotate_layer.weight
+            W = self.learned_source.weight.to(R.dtype)
+            b = self.learned_source.bias.to(R.dtype)
+            fused = torch.nn.Linear(self.embed_dim, self.embed_dim)
+            fused.weight.copy_(R @ (W - R.T))
+            fused.bias.copy_(b @ R.T)
+        self.fused_layer = fused.to(device=R.device, dtype=R.dtype)
+
 
 class NoreftIntervention(
     SourcelessIntervention,
@@ -105,11 +381,18 @@ class NoreftIntervention(
     def forward(
         self, base, source=None, subspaces=None
     ):
-        proj_base = self.proj_layer(base)
-        output = base + torch.matmul(
-            (self.act_fn(self.learned_source(base)) - proj_base), self.proj_layer.weight
-        )
-        return self.dropout(output.to(base.dtype))
+        return _noreft_core(
+            base, self.proj_layer, self.learned_source,
+            self.act_fn, self.dropout)
+
+    def eval_int8(self):
+        """
+        Swap learned_source for a weight-only int8 linear (inference only).
+
+        On CPU the quantized module expects fp32 inputs; see _int8_linear.
+        """
+        assert not self.training
+        self.learned_source = _int8_linear(self.learned_source)
 
 
 class ConsreftIntervention(
@@ -130,11 +413,14 @@ class ConsreftIntervention(
     def forward(
         self, base, source=None, subspaces=None
     ):
-        rotated_base = self.rotate_layer(base)
-        output = base + torch.matmul(
-            (self.learned_source - rotated_base), self.rotate_layer.weight.T
-        )
-        return output.to(base.dtype)
+        return _consreft_core(base, self.rotate_layer, self.learned_source)
+
+    def materialize_rotation(self):
+        """
+        Drop the orthogonal parametrization on rotate_layer (inference only).
+        """
+        assert not self.training
+        _materialize_rotation(self.rotate_layer)
 
 
 class LobireftIntervention(
@@ -156,10 +442,15 @@ class LobireftIntervention(
     def forward(
         self, base, source=None, subspaces=None
     ):
-        output = base + torch.matmul(
-            self.learned_source, self.rotate_layer.weight.T
-        )
-        return self.dropout(output.to(base.dtype))
+        return _lobireft_core(
+            base, self.rotate_layer, self.learned_source, self.dropout)
+
+    def materialize_rotation(self):
+        """
+        Drop the orthogonal parametrization on rotate_layer (inference only).
+        """
+        assert not self.training
+        _materialize_rotation(self.rotate_layer)
 
 
 class DireftIntervention(
@@ -178,16 +469,45 @@ class DireftIntervention(
             self.embed_dim, kwargs["low_rank_dimension"]).to(
             kwargs["dtype"] if "dtype" in kwargs else torch.bfloat16)
         self.dropout = torch.nn.Dropout(kwargs["dropout"] if "dropout" in kwargs else 0.0)
-        self.act_fn = ACT2FN["linear"] if "act_fn" not in kwargs or kwargs["act_fn"] is None else ACT2FN[kwargs["act_fn"]]
-        
+        self.act_fn_name = kwargs["act_fn"] if "act_fn" in kwargs and kwargs["act_fn"] is not None else "linear"
+        self.act_fn = ACT2FN[self.act_fn_name]
+        self.fused_layer = None
+
     def forward(
         self, base, source=None, subspaces=None
     ):
-        cast_base = base.to(self.learned_source.weight.dtype)
-        output = base + torch.matmul(
-            (self.act_fn(self.learned_source(cast_base))).to(self.rotate_layer.weight.dtype), self.rotate_layer.weight.T
-        )
-        return self.dropout(output.to(base.dtype))
+        if self.fused_layer is not None and not self.training:
+            cast_base = base.to(self.fused_layer.weight.dtype)
+            return self.dropout(
+                (cast_base + self.fused_layer(cast_base)).to(base.dtype))
+        return _direft_core(
+            base, self.rotate_layer, self.learned_source,
+            self.act_fn, self.dropout)
+
+    def materialize_rotation(self):
+        """
+        Drop the orthogonal parametrization on rotate_layer (inference only).
+        """
+        assert not self.training
+        _materialize_rotation(self.rotate_layer)
+
+    def fuse_for_inference(self):
+        """
+        Collapse the forward into one d->d affine map (inference only).
+
+        With an identity act_fn, h + (hW^T + b)R^T reduces to
+        h + h(RW)^T + bR^T. Same dense d x d tradeoff as the LoReFT
+        variant; fuse after loading, not before saving.
+        """
+        assert not self.training and self.act_fn_name == "linear"
+        with torch.no_grad():
+            R = self.rotate_layer.weight
+            W = self.learned_source.weight.to(R.dtype)
+            b = self.learned_source.bias.to(R.dtype)
+            fused = torch.nn.Linear(self.embed_dim, self.embed_dim)
+            fused.weight.copy_(R @ W)
+            fused.bias.copy_(b @ R.T)
+        self.fused_layer = fused.to(device=R.device, dtype=R.dtype)
 
 
 class NodireftIntervention(
@@ -212,8 +532,16 @@ class NodireftIntervention(
     def forward(
         self, base, source=None, subspaces=None
     ):
-        output = base + torch.matmul(
-            self.act_fn(self.learned_source(base)), self.proj_layer.weight
-        )
-        return self.dropout(output.to(base.dtype))
+        return _nodireft_core(
+            base, self.proj_layer, self.learned_source,
+            self.act_fn, self.dropout)
+
+    def eval_int8(self):
+        """
+        Swap learned_source for a weight-only int8 linear (inference only).
+
+        On CPU the quantized module expects fp32 inputs; see _int8_linear.
+        """
+        assert not self.training
+        self.learned_source = _int8_linear(self.learned_source)
 
@@ -26,6 +26,43 @@ class ReftModel(pv.IntervenableModel):
         model = pv.IntervenableModel.load(*args, **kwargs)
         return ReftModel._convert_to_reft_model(model)
 
+    def to_ddp(self, process_group=None):
+        """
+        Synchronize only the trainable interventions across ranks.
+
+        The base LM is typically frozen in ReFT training, so wrapping the
+        whole model in DDP would bucket and traverse billions of
+        parameters that never produce gradients. Wrapping just the
+        interventions in DistributedDataParallel does not work either:
+        pyvene dispatches on isinstance checks and attribute reads of
+        interventions[key][0], and DDP's "module."-prefixed state_dict
+        bypasses the interventions' custom state_dict overrides on save.
+
+        Instead, self.interventions is left untouched: intervention
+        parameters are broadcast from rank 0 so all ranks start
+        identical, and each trainable parameter gets a gradient hook
+        that all-reduce-averages it as backward produces it, overlapping
+        communication with the rest of backward. Requires
+        torch.distributed to be initialized; call after moving the model
+        to its device.
+        """
+        import torch.distributed as dist
+
+        world_size = dist.get_world_size(process_group)
+
+        def allreduce_hook(grad):
+            grad = grad / world_size
+            dist.all_reduce(grad, group=process_group)
+            return grad
+
+        for k, v in self.interventions.items():
+            if isinstance(v[0], pv.TrainableIntervention):
+                for p in v[0].parameters():
+                    dist.broadcast(p.data, src=0, group=process_group)
+                    if p.requires_grad:
+                        p.register_hook(allreduce_hook)
+        return self
+
     def print_trainable_parameters(self):
         """
         Print trainable parameters.
@@ -41,11 +78,14 @@ class ReftModel(pv.IntervenableModel):
                 else:
                     trainable_intervention_parameters += count_parameters(v[0])
 
-        trainable_model_parameters = sum(
-            p.numel() for p in self.model.parameters() if p.requires_grad)
-
-        all_model_parameters = sum(
-            p.numel() for p in self.model.parameters())
+        # single walk over the (potentially huge) base model parameter list
+        all_model_parameters = 0
+        trainable_model_parameters = 0
+        for p in self.model.parameters():
+            n = p.numel()
+            all_model_parameters += n
+            if p.requires_grad:
+                trainable_model_parameters += n
 
         total_trainable_parameters = trainable_intervention_parameters + trainable_model_parameters
         
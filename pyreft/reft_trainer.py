@@ -4,7 +4,6 @@ from torch.utils.data import DataLoader
 from transformers import (
     Trainer,
     TrainingArguments,
-    DataCollator,
     DataCollatorForSeq2Seq,
     AutoTokenizer
 )
@@ -14,8 +13,6 @@ from transformers.trainer_utils import (
     denumpify_detensorize
 )
 from datasets import Dataset
-from dataclasses import dataclass
-from typing import Dict, Optional, Sequence
 
 from tqdm import tqdm
 import os
@@ -26,19 +23,9 @@ import numpy as np
 from torch.nn import BCEWithLogitsLoss, CrossEntropyLoss, MSELoss
 from transformers.utils import logging
 
-logger = logging.get_logger(__name__)
-
-@dataclass
-class ReftDataCollator(object):
-    """Collate examples for ReFT."""
+from .dataset import ReftDataCollator
 
-    data_collator: DataCollator
-
-    def __call__(self, instances: Sequence[Dict]) -> Dict[str, torch.Tensor]:
-        batch_inputs = self.data_collator(instances)
-        max_seq_length = batch_inputs["input_ids"].shape[-1]
-        batch_inputs["intervention_locations"] = batch_inputs["intervention_locations"][..., :max_seq_length]
-        return batch_inputs
+logger = logging.get_logger(__name__)
 
 
 def make_data_collator(tokenizer, model) -> ReftDataCollator:
@@ -53,7 +40,10 @@ def make_data_collator(tokenizer, model) -> ReftDataCollator:
 
 
 def make_dataloader(dataset: Dataset, batch_size: int, collate_fn: DataCollatorForSeq2Seq, shuffle: bool) -> DataLoader:
-    return DataLoader(dataset, shuffle=shuffle, batch_size=batch_size, collate_fn=collate_fn)
+    # pinned host memory lets the per-batch H2D copies run async
+    return DataLoader(
+        dataset, shuffle=shuffle, batch_size=batch_size, collate_fn=collate_fn,
+        pin_memory=torch.cuda.is_available())
 
 
 class ReftTrainer(Trainer):
@@ -195,7 +185,7 @@ class ReftTrainerForSequenceClassification(ReftTrainer):
             for step, inputs in enumerate(eval_iterator):
                 for k, v in inputs.items():
                     if v is not None and isinstance(v, torch.Tensor):
-                        inputs[k] = v.to(self.model.get_device())
+                        inputs[k] = v.to(self.model.get_device(), non_blocking=True)
                 
                 # [layers, batch_size, positions]
                 intervention_locations = inputs["intervention_locations"].permute(1, 0, 2).tolist()
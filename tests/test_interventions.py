@@ -0,0 +1,50 @@
+import pytest
+import torch
+
+from pyreft.interventions import _HAS_TRITON, LoreftIntervention
+
+requires_fused_kernel = pytest.mark.skipif(
+    not (_HAS_TRITON and torch.cuda.is_available()),
+    reason="fused LoReFT kernel requires triton and a CUDA device",
+)
+
+
+@requires_fused_kernel
+@pytest.mark.parametrize("low_rank_dimension", [4, 128])
+@pytest.mark.parametrize("act_fn", [None, "relu"])
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16])
+def test_fused_loreft_matches_eager(low_rank_dimension, act_fn, dtype):
+    torch.manual_seed(42)
+    intervention = LoreftIntervention(
+        embed_dim=256,
+        low_rank_dimension=low_rank_dimension,
+        dtype=dtype,
+        act_fn=act_fn,
+    ).to("cuda")
+    intervention.eval()
+    base = torch.randn(2, 8, 256, device="cuda", dtype=dtype)
+
+    with torch.no_grad():
+        assert intervention._use_fused_fwd(base)
+        fused_out = intervention(base)
+        # force the eager path on the same weights
+        intervention._fused_eligible = False
+        eager_out = intervention(base)
+
+    torch.testing.assert_close(fused_out, eager_out, rtol=2e-2, atol=2e-2)
+
+
+@requires_fused_kernel
+def test_fused_loreft_default_dtypes():
+    # the README-standard setup: bf16 learned_source, fp32 rotate layer;
+    # the kernel must cast R rather than fail the first eval forward
+    intervention = LoreftIntervention(
+        embed_dim=256, low_rank_dimension=8, dtype=torch.bfloat16).to("cuda")
+    intervention.eval()
+    base = torch.randn(2, 8, 256, device="cuda", dtype=torch.bfloat16)
+
+    with torch.no_grad():
+        out = intervention(base)
+
+    assert out.dtype == base.dtype
+    assert torch.isfinite(out.float()).all()